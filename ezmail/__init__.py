@@ -8,7 +8,7 @@ attachments.
 Modules:
     sender (module): Implements the EzSender class for composing and sending emails via SMTP.
     reader (module): Implements the EzReader class for reading and managing emails via IMAP.
-    mail (module): Defines the EzMail data model representing individual emails.
+    mail (module): Defines the EzMail and EzAttachment data models representing retrieved emails.
     utils (module): Provides helper functions for validating templates, images, and configurations.
 
 Example:
@@ -35,7 +35,7 @@ Example:
 
 from .ezsender import EzSender
 from .ezreader import EzReader
-from .ezmail import EzMail
+from .ezmail import EzMail, EzAttachment
 
 __version__ = "2.5.0"
-__all__ = ["EzSender", "EzReader", "EzMail", "__version__"]
+__all__ = ["EzSender", "EzReader", "EzMail", "EzAttachment", "__version__"]
@@ -1,7 +1,52 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable
+
+
+class EzAttachment:
+    """Represents an attachment of an email retrieved by EzReader.
+
+    Attachments listed with ``include_attachments=False`` are downloaded from
+    the server only when `data` is first accessed.
+    Dict-style access (``attachment["data"]``) is supported for backward
+    compatibility.
+    """
+
+    _KEYS = ("filename", "content_type", "data")
+
+    def __init__(
+        self,
+        filename: str,
+        content_type: str,
+        data: bytes | None = None,
+        loader: Callable[[], bytes | None] | None = None,
+    ):
+        self.filename = filename
+        self.content_type = content_type
+        self._data = data
+        self._loader = loader
+
+    @property
+    def data(self) -> bytes | None:
+        if self._loader is not None:
+            self._data = self._loader()
+            self._loader = None
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self._KEYS else default
+
+    def keys(self) -> tuple[str, ...]:
+        return self._KEYS
+
+    def __repr__(self) -> str:
+        return f"<EzAttachment filename={self.filename!r} content_type={self.content_type!r}>"
 
 
 class EzMail:
@@ -12,17 +57,45 @@ class EzMail:
         uid: str,
         sender: str,
         subject: str,
-        body: str,
-        attachments: list[dict[str, Any]] | None = None,
+        body: str = "",
+        attachments: list[EzAttachment] | None = None,
         date: datetime | None = None,
+        body_loader: Callable[[], str] | None = None,
+        attachments_loader: Callable[[], list[EzAttachment]] | None = None,
     ):
         self.uid = uid
         self.sender = sender
         self.subject = subject
-        self.body = body
-        self.attachments = attachments or []
+        self._body = body
+        self._body_loader = body_loader
+        self._attachments = attachments or []
+        self._attachments_loader = attachments_loader
         self.date = date
 
+    @property
+    def body(self) -> str:
+        if self._body_loader is not None:
+            self._body = self._body_loader()
+            self._body_loader = None
+        return self._body
+
+    @body.setter
+    def body(self, value: str) -> None:
+        self._body = value
+        self._body_loader = None
+
+    @property
+    def attachments(self) -> list[EzAttachment]:
+        if self._attachments_loader is not None:
+            self._attachments = self._attachments_loader()
+            self._attachments_loader = None
+        return self._attachments
+
+    @attachments.setter
+    def attachments(self, value: list[EzAttachment]) -> None:
+        self._attachments = value
+        self._attachments_loader = None
+
     def has_attachments(self) -> bool:
         return bool(self.attachments)
 
@@ -1,18 +1,347 @@
 from __future__ import annotations
 
 import logging
+import re
 from imaplib import IMAP4_SSL
-from email import message_from_bytes
-from email.utils import parsedate_to_datetime
-from base64 import b64encode
-from typing import Any
+from email import message_from_bytes, policy
+from email.message import Message
+from email.parser import BytesHeaderParser
+from email.utils import parsedate_to_datetime, decode_rfc2231
+from urllib.parse import unquote
+from base64 import b64encode, b64decode
+from quopri import decodestring
+from typing import Any, Callable
 from datetime import datetime
 
-from .utils import validate_protocol_config, validate_account, validate_date, _safe_decode
-from .ezmail import EzMail
+from .utils import validate_protocol_config, validate_account, validate_date, _safe_decode, _tls_context
+from .ezmail import EzMail, EzAttachment
 
 _logger = logging.getLogger(__name__)
 
+# Maximum number of UIDs requested by a single UID FETCH command.
+_FETCH_BATCH_SIZE = 500
+
+# Deepest MIME nesting inspected for attachments; deeper parts are ignored.
+_MAX_MIME_DEPTH = 16
+
+_HEADER_PARSER = BytesHeaderParser()
+_HEADER_END_RE = re.compile(rb"\r?\n\r?\n")
+
+_OPEN, _CLOSE = object(), object()
+_LITERAL_RE = re.compile(rb"\{\d+\}\s*$")
+
+# One LIST response line: (<flags>) <"delim" | NIL> <name>
+_MAILBOX_RE = re.compile(rb'\((?P<flags>[^)]*)\) (?:"(?P<delim>(?:[^"\\]|\\.)*)"|NIL) (?P<name>.*)', re.I | re.S)
+_UNESCAPE_RE = re.compile(rb'\\(.)', re.S)
+
+
+def _quote_string(value: str) -> str:
+    """Quote a value as an IMAP quoted string, escaping backslashes and quotes.
+
+    imaplib sends command arguments verbatim, so an unescaped ``"`` in a
+    search value would otherwise break (or alter) the SEARCH command. CR and
+    LF cannot appear in a quoted string at all: they would end the command
+    line and let the rest of the value run as a new command.
+
+    Raises:
+        ValueError: If `value` contains a CR or LF character.
+    """
+    if "\r" in value or "\n" in value:
+        raise ValueError("Search values must not contain CR or LF characters.")
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _tokenize(text: bytes, tokens: list) -> None:
+    """Split a chunk of IMAP response text into tokens.
+
+    Parentheses become the `_OPEN`/`_CLOSE` markers, ``NIL`` becomes None and
+    quoted strings and atoms become bytes. Atoms keep bracketed sections
+    intact (e.g. ``BODY[HEADER.FIELDS (FROM)]``).
+    """
+    i, n = 0, len(text)
+    while i < n:
+        c = text[i]
+        if c in b" \r\n":
+            i += 1
+        elif c == ord("("):
+            tokens.append(_OPEN)
+            i += 1
+        elif c == ord(")"):
+            tokens.append(_CLOSE)
+            i += 1
+        elif c == ord('"'):
+            value = bytearray()
+            i += 1
+            while i < n and text[i] != ord('"'):
+                if text[i] == ord("\\") and i + 1 < n:
+                    i += 1
+                value.append(text[i])
+                i += 1
+            tokens.append(bytes(value))
+            i += 1
+        else:
+            start = i
+            depth = 0
+            while i < n:
+                c = text[i]
+                if c == ord("["):
+                    depth += 1
+                elif c == ord("]"):
+                    depth -= 1
+                elif depth <= 0 and c in b" ()\r\n":
+                    break
+                i += 1
+            atom = text[start:i]
+            tokens.append(None if atom.upper() == b"NIL" else atom)
+
+
+def _build_lists(tokens: list) -> list:
+    """Nest a flat token list into Python lists following the parentheses."""
+    stack: list[list] = [[]]
+    for token in tokens:
+        if token is _OPEN:
+            stack.append([])
+        elif token is _CLOSE:
+            if len(stack) > 1:
+                closed = stack.pop()
+                stack[-1].append(closed)
+        else:
+            stack[-1].append(token)
+    while len(stack) > 1:
+        closed = stack.pop()
+        stack[-1].append(closed)
+    return stack[0]
+
+
+def _parse_fetch_response(data: list) -> list[dict[bytes, Any]]:
+    """Parse the data returned by an IMAP (UID) FETCH command.
+
+    Handles several messages per response and literals (``{n}`` followed by
+    the raw bytes, as returned by imaplib in tuples) anywhere in the list.
+
+    Args:
+        data (list): Raw `data` list returned by ``imaplib`` for a FETCH.
+
+    Returns:
+        list[dict[bytes, Any]]: One dict per message mapping upper-cased item
+            names (e.g. ``b"UID"``, ``b"BODY[]"``) to their values: bytes,
+            None or nested lists.
+    """
+    tokens: list = []
+    for item in data or []:
+        if isinstance(item, tuple):
+            _tokenize(_LITERAL_RE.sub(b"", item[0]), tokens)
+            tokens.append(item[1])
+        elif isinstance(item, bytes):
+            _tokenize(item, tokens)
+
+    responses = []
+    for value in _build_lists(tokens):
+        if isinstance(value, list):
+            pairs = value[:len(value) - len(value) % 2]
+            responses.append({
+                pairs[i].upper(): pairs[i + 1]
+                for i in range(0, len(pairs), 2)
+                if isinstance(pairs[i], bytes)
+            })
+    return responses
+
+
+def _parse_list_entry(item: bytes | tuple) -> tuple[set[str], str | None, str] | None:
+    """Parse one entry of an IMAP LIST response.
+
+    The mailbox name may be an atom, a quoted string (with ``\\`` escapes) or
+    a literal, which imaplib returns as a ``(line, name)`` tuple.
+
+    Args:
+        item (bytes | tuple): One element of the `data` list returned by LIST.
+
+    Returns:
+        tuple[set[str], str | None, str] | None: (attributes, delimiter, name),
+            or None if the entry is not a LIST response.
+    """
+    line, literal = (item[0], item[1]) if isinstance(item, tuple) else (item, None)
+    if not isinstance(line, bytes):
+        return None
+    match = _MAILBOX_RE.match(line.strip())
+    if not match:
+        return None
+
+    name = match.group("name").strip()
+    if literal is not None:
+        name = literal
+    elif name.startswith(b'"') and name.endswith(b'"') and len(name) >= 2:
+        name = _UNESCAPE_RE.sub(rb"\1", name[1:-1])
+
+    delim = match.group("delim")
+    attrs = set(match.group("flags").decode(errors="ignore").split())
+    return (
+        attrs,
+        _UNESCAPE_RE.sub(rb"\1", delim).decode(errors="ignore") if delim is not None else None,
+        name.decode(errors="replace"),
+    )
+
+
+def _decode_body(part: Message | None) -> str:
+    """Decode the plain-text body of `part` ("" if missing or undecodable)."""
+    if part is None:
+        return ""
+    try:
+        return part.get_content().strip() # type: ignore
+    except Exception:
+        pass
+    try:
+        return (part.get_payload(decode=True) or b"").decode(errors="ignore").strip()
+    except Exception:
+        return ""
+
+
+def _parse_headers(raw: bytes) -> Message:
+    """Parse only the header block of a raw message.
+
+    The body is sliced off before parsing, so the cost depends on the header
+    size instead of the full message size (attachments included).
+    """
+    end = _HEADER_END_RE.search(raw)
+    return _HEADER_PARSER.parsebytes(raw[:end.end()] if end else raw)
+
+
+def _iter_leaf_parts(msg: Message, max_depth: int = _MAX_MIME_DEPTH):
+    """Yield the non-multipart parts of `msg` in document order.
+
+    Unlike ``Message.walk()`` the traversal is iterative and stops descending
+    after `max_depth` levels, so long forward chains or pathological nesting
+    cannot blow up the time (or recursion) spent looking for attachments.
+
+    Args:
+        msg (Message): Parsed message.
+        max_depth (int): Maximum container depth to descend into.
+
+    Yields:
+        Message: Leaf parts.
+    """
+    stack = [(msg, 0)]
+    while stack:
+        part, depth = stack.pop()
+        if not part.is_multipart():
+            yield part
+        elif depth < max_depth:
+            children = part.get_payload()
+            stack.extend((child, depth + 1) for child in reversed(children))
+        else:
+            _logger.warning("MIME tree deeper than %d levels; inner parts skipped.", max_depth)
+
+
+def _extract_content(raw: bytes) -> tuple[str, list[EzAttachment]]:
+    """Parse the MIME tree of `raw` into the plain-text body and attachments.
+
+    Attachment payloads are decoded here so that nothing keeps a reference to
+    `raw` (or to the still encoded parts) once the message is built.
+
+    Args:
+        raw (bytes): Full message as returned by ``BODY[]``.
+
+    Returns:
+        tuple[str, list[EzAttachment]]: Body chosen by ``get_body()`` and every
+            file part with its decoded data.
+    """
+    msg = message_from_bytes(raw, policy=policy.default)
+    body = _decode_body(msg.get_body(preferencelist=("plain",)))
+    attachments: list[EzAttachment] = []
+
+    # Not iter_attachments(): it only inspects top-level parts and skips
+    # files inside multipart/related, which include_attachments=False
+    # (BODYSTRUCTURE) still reports.
+    for part in _iter_leaf_parts(msg):
+        filename = part.get_filename()
+        if filename:
+            try:
+                data = part.get_payload(decode=True)
+            except Exception:
+                data = None
+            attachments.append(EzAttachment(
+                filename=_safe_decode(filename),
+                content_type=part.get_content_type(),
+                data=data,
+            ))
+
+    return body, attachments
+
+
+def _structure_param(params: Any, name: bytes) -> str | None:
+    """Read a parameter from a BODYSTRUCTURE parameter list.
+
+    Supports plain, RFC 2047 encoded and RFC 2231 (``name*``) values.
+    """
+    if not isinstance(params, list):
+        return None
+    values = {
+        params[i].lower(): params[i + 1]
+        for i in range(0, len(params) - 1, 2)
+        if isinstance(params[i], bytes) and isinstance(params[i + 1], bytes)
+    }
+    if name + b"*" in values:
+        charset, _, value = decode_rfc2231(values[name + b"*"].decode(errors="ignore"))
+        try:
+            return unquote(value, encoding=charset or "us-ascii", errors="replace")
+        except LookupError:
+            return unquote(value, errors="replace")
+    if name in values:
+        return _safe_decode(values[name].decode(errors="ignore"))
+    return None
+
+
+def _walk_bodystructure(structure: list, section: str = "", depth: int = 0):
+    """Yield ``(section, leaf)`` for every non-multipart part of a BODYSTRUCTURE.
+
+    Containers nested deeper than `_MAX_MIME_DEPTH` are not descended into.
+
+    Args:
+        structure (list): Parsed BODYSTRUCTURE (see `_parse_fetch_response`).
+        section (str): Section number of `structure` ("" for the top level).
+        depth (int): Nesting level of `structure`.
+
+    Yields:
+        tuple[str, list]: IMAP section specifier (e.g. "1.2") and the leaf fields.
+    """
+    if structure and isinstance(structure[0], list):
+        if depth >= _MAX_MIME_DEPTH:
+            _logger.warning("MIME tree deeper than %d levels; inner parts skipped.", _MAX_MIME_DEPTH)
+            return
+        index = 0
+        for child in structure:
+            if not isinstance(child, list):
+                break
+            index += 1
+            yield from _walk_bodystructure(child, f"{section}.{index}" if section else str(index), depth + 1)
+    else:
+        yield section or "1", structure
+
+
+def _leaf_disposition(leaf: list) -> tuple[bytes, Any]:
+    """Return the (disposition type, params) of a BODYSTRUCTURE leaf."""
+    content_type = b"/".join(leaf[:2]).lower() if len(leaf) > 1 else b""
+    if content_type.startswith(b"text/"):
+        index = 9
+    elif content_type == b"message/rfc822":
+        index = 11
+    else:
+        index = 8
+    disposition = leaf[index] if len(leaf) > index else None
+    if isinstance(disposition, list) and disposition and isinstance(disposition[0], bytes):
+        return disposition[0].lower(), disposition[1] if len(disposition) > 1 else None
+    return b"", None
+
+
+def _decode_transfer(data: bytes, encoding: Any) -> bytes:
+    """Undo a Content-Transfer-Encoding on raw section bytes."""
+    encoding = (encoding or b"").lower() if isinstance(encoding, bytes) else b""
+    if encoding == b"base64":
+        return b64decode(data)
+    if encoding == b"quoted-printable":
+        return decodestring(data)
+    return data
+
 
 class EzReader:
     """High-level IMAP client for reading and managing emails.
@@ -95,7 +424,7 @@ class EzReader:
         if self.auth_type not in ("password", "oauth2"):
             raise ValueError("Invalid authentication type. Use 'password' or 'oauth2'.")
         try:
-            self.mail = IMAP4_SSL(self.imap_server, self.imap_port)
+            self.mail = IMAP4_SSL(self.imap_server, self.imap_port, ssl_context=_tls_context())
             if self.auth_type == "password":
                 self.mail.login(self.user_email, self.auth_value)
             else:
@@ -128,7 +457,8 @@ class EzReader:
             status, mailboxes = self.mail.list()
             if status != "OK":
                 raise RuntimeError("Unable to retrieve mailbox list.")
-            return [box.decode().split(' "/" ')[-1] for box in mailboxes]
+            entries = (_parse_list_entry(box) for box in mailboxes or [])
+            return [entry[2] for entry in entries if entry]
         except Exception as e:
             raise RuntimeError(f"Failed to list mailboxes: {e}") from e
 
@@ -166,23 +496,11 @@ class EzReader:
         if status != "OK":
             raise RuntimeError("Unable to retrieve mailbox list.")
         parsed = []
-        for raw in lines or []:
-            s = raw.decode(errors="ignore")
-            # Format: (<attrs>) "delim" name
-            left = s.find("(")
-            right = s.find(")")
-            attrs = set()
-            if left != -1 and right != -1 and right > left:
-                attrs = set(a.strip() for a in s[left + 1:right].split() if a.strip())
-            rest = s[right + 1:].strip()
-            delim = None
-            if rest.startswith('"'):
-                delim_end = rest.find('"', 1)
-                if delim_end != -1:
-                    delim = rest[1:delim_end]
-                    rest = rest[delim_end + 1:].strip()
-            name = rest.strip().strip('"')
-            parsed.append((attrs, delim or "/", name))
+        for item in lines or []:
+            entry = _parse_list_entry(item)
+            if entry:
+                attrs, delim, name = entry
+                parsed.append((attrs, delim or "/", name))
         return parsed
 
     def fetch_messages(
@@ -198,6 +516,7 @@ class EzReader:
         since: datetime | None = None,
         before: datetime | None = None,
         uids: list[str] | None = None,
+        include_attachments: bool = True,
     ) -> list[EzMail]:
         """Search and fetch messages with flexible IMAP filters.
 
@@ -217,6 +536,10 @@ class EzReader:
             since (datetime | None, optional): Lower bound date (SINCE).
             before (datetime | None, optional): Upper bound (exclusive) date (BEFORE).
             uids (list[str] | None, optional): Fetch specific UIDs directly, bypassing search.
+            include_attachments (bool, optional): If False, only headers, the
+                MIME structure and the plain-text part are downloaded; attachment
+                data is then fetched from the server on first access (the
+                connection must still be open). Defaults to True.
 
         Returns:
             list[EzMail]: Messages with:
@@ -224,10 +547,13 @@ class EzReader:
                 - sender (str): Raw "From" header.
                 - subject (str): Decoded subject.
                 - body (str): Plain-text body (if present).
-                - attachments (list[dict]): In-memory attachments (filename, content_type, data).
+                - attachments (list[EzAttachment]): In-memory attachments (filename,
+                  content_type, data); with ``include_attachments=False``,
+                  `data` is downloaded on first access.
                 - date (datetime | None): Parsed Date header.
 
         Raises:
+            ValueError: If a search value contains CR or LF characters.
             RuntimeError: If not connected, search fails, or parsing fails.
 
         Example:
@@ -238,25 +564,25 @@ class EzReader:
             raise RuntimeError("Not connected to any IMAP server.")
 
         # Build IMAP search criteria
-        criteria = f"({status}"
+        terms = [status]
         if sender:
-            criteria += f' FROM "{sender}"'
+            terms += ["FROM", _quote_string(sender)]
         if subject:
-            criteria += f' SUBJECT "{subject}"'
+            terms += ["SUBJECT", _quote_string(subject)]
         if text:
-            criteria += f' TEXT "{text}"'
+            terms += ["TEXT", _quote_string(text)]
         if body:
-            criteria += f' BODY "{body}"'
+            terms += ["BODY", _quote_string(body)]
         if date:
             validate_date(date)
-            criteria += f' ON {date.strftime("%d-%b-%Y")}'
+            terms += ["ON", date.strftime("%d-%b-%Y")]
         if since:
             validate_date(since)
-            criteria += f' SINCE {since.strftime("%d-%b-%Y")}'
+            terms += ["SINCE", since.strftime("%d-%b-%Y")]
         if before:
             validate_date(before)
-            criteria += f' BEFORE {before.strftime("%d-%b-%Y")}'
-        criteria += ")"
+            terms += ["BEFORE", before.strftime("%d-%b-%Y")]
+        criteria = f"({' '.join(terms)})"
 
         try:
             status_select, _ = self.mail.select(mailbox)
@@ -274,75 +600,190 @@ class EzReader:
             if limit and not uids:
                 search_uids = search_uids[:limit]
 
+            if not include_attachments:
+                return self._fetch_without_attachments(search_uids, mailbox)
+
+            fetched = self._uid_fetch(search_uids, "(UID BODY.PEEK[])")
+
             emails = []
             for uid in search_uids:
                 uid_str = uid.decode()
-
-                # Do not set \Seen flag while fetching
-                status_fetch, msg_data = self.mail.uid("FETCH", uid_str, "(BODY.PEEK[])")
-                if status_fetch != "OK" or not msg_data or not msg_data[0]:
+                raw = fetched.get(uid_str, {}).get(b"BODY[]")
+                if not isinstance(raw, bytes):
                     continue
+                emails.append(self._parse_message(uid_str, raw))
 
-                msg = message_from_bytes(msg_data[0][1])
+            return emails
 
-                subject_decoded = _safe_decode(msg.get("Subject", ""))
-                sender_decoded = _safe_decode(msg.get("From", ""))
-                raw_date = msg.get("Date")
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch emails with the criteria {criteria}: {e}") from e
+
+    def _uid_fetch(self, uids: list[bytes], items: str) -> dict[str, dict[bytes, Any]]:
+        """Run ``UID FETCH`` for many UIDs in batches of `_FETCH_BATCH_SIZE`.
+
+        Args:
+            uids (list[bytes]): UIDs to fetch.
+            items (str): FETCH data items, which must include ``UID``.
+
+        Returns:
+            dict[str, dict[bytes, Any]]: Parsed items keyed by UID.
+        """
+        fetched: dict[str, dict[bytes, Any]] = {}
+        for start in range(0, len(uids), _FETCH_BATCH_SIZE):
+            batch = [uid.decode() for uid in uids[start:start + _FETCH_BATCH_SIZE]]
+            status_fetch, msg_data = self.mail.uid("FETCH", ",".join(batch), items) # type: ignore
+            if status_fetch != "OK":
+                continue
+            for item in _parse_fetch_response(msg_data):
+                uid_value = item.get(b"UID")
+                if isinstance(uid_value, bytes):
+                    fetched.setdefault(uid_value.decode(), {}).update(item)
+        return fetched
+
+    def _section_loader(self, uid: str, mailbox: str, section: str, encoding: Any) -> Callable[[], bytes | None]:
+        """Return a callable that downloads and decodes one body section on demand."""
+        def load() -> bytes | None:
+            if not self.mail:
+                raise RuntimeError("Not connected to any IMAP server.")
+            self.mail.select(mailbox)
+            item = self._uid_fetch([uid.encode()], f"(UID BODY.PEEK[{section}])").get(uid, {})
+            data = item.get(f"BODY[{section}]".encode())
+            return _decode_transfer(data, encoding) if isinstance(data, bytes) else None
+        return load
+
+    def _fetch_without_attachments(self, uids: list[bytes], mailbox: str) -> list[EzMail]:
+        """Fetch headers and plain-text bodies only, leaving attachments on the server.
 
+        The first round trip fetches ``BODYSTRUCTURE`` and headers; the second
+        fetches only the plain-text section of each message (grouped by section
+        number). Attachments are listed from the structure and downloaded
+        lazily when their `data` is accessed.
+
+        Args:
+            uids (list[bytes]): UIDs to fetch.
+            mailbox (str): Selected mailbox (used when attachments are loaded later).
+
+        Returns:
+            list[EzMail]: Messages in the order of `uids`.
+        """
+        fetched = self._uid_fetch(uids, "(UID BODYSTRUCTURE BODY.PEEK[HEADER])")
+
+        text_parts: dict[str, tuple[str, Any, str | None]] = {}
+        file_parts: dict[str, list[EzAttachment]] = {}
+        for uid_str, item in fetched.items():
+            structure = item.get(b"BODYSTRUCTURE")
+            if not isinstance(structure, list):
+                continue
+            file_parts[uid_str] = []
+            for section, leaf in _walk_bodystructure(structure):
+                if len(leaf) < 6 or not all(isinstance(v, bytes) for v in leaf[:2]):
+                    continue
+                content_type = b"/".join(leaf[:2]).decode(errors="ignore").lower()
+                disposition, disposition_params = _leaf_disposition(leaf)
+                filename = _structure_param(disposition_params, b"filename") or _structure_param(leaf[2], b"name")
+
+                if content_type == "text/plain" and disposition != b"attachment" and uid_str not in text_parts:
+                    text_parts[uid_str] = (section, leaf[5], _structure_param(leaf[2], b"charset"))
+                if filename:
+                    file_parts[uid_str].append(EzAttachment(
+                        filename=filename,
+                        content_type=content_type,
+                        loader=self._section_loader(uid_str, mailbox, section, leaf[5]),
+                    ))
+
+        # Second round trip: one FETCH per distinct text section
+        uids_by_section: dict[str, list[bytes]] = {}
+        for uid_str, (section, _, _) in text_parts.items():
+            uids_by_section.setdefault(section, []).append(uid_str.encode())
+        bodies: dict[str, bytes] = {}
+        for section, section_uids in uids_by_section.items():
+            key = f"BODY[{section}]".encode()
+            for uid_str, item in self._uid_fetch(section_uids, f"(UID BODY.PEEK[{section}])").items():
+                if isinstance(item.get(key), bytes):
+                    bodies[uid_str] = item[key]
+
+        emails = []
+        for uid in uids:
+            uid_str = uid.decode()
+            item = fetched.get(uid_str)
+            if item is None:
+                continue
+            header = item.get(b"BODY[HEADER]")
+            msg = _HEADER_PARSER.parsebytes(header if isinstance(header, bytes) else b"")
+
+            body = ""
+            if uid_str in bodies:
+                _, encoding, charset = text_parts[uid_str]
                 try:
-                    email_date = parsedate_to_datetime(raw_date) if raw_date else None
+                    body = _safe_decode(_decode_transfer(bodies[uid_str], encoding), charset).strip()
                 except Exception:
-                    email_date = None
-
-                body_content = ""
-                attachments: list[dict[str, Any]] = []
-
-                for part in msg.walk():
-                    content_disposition = str(part.get("Content-Disposition", "")).lower()
-                    content_type = part.get_content_type()
-
-                    if part.is_multipart():
-                        continue
-
-                    if content_type == "text/plain" and "attachment" not in content_disposition:
-                        try:
-                            body_content = part.get_payload(decode=True).decode(errors="ignore")
-                        except Exception:
-                            pass
-
-                    filename = part.get_filename()
-                    if filename:
-                        filename = _safe_decode(filename)
-                        try:
-                            file_data = part.get_payload(decode=True)
-                            attachments.append({
-                                "filename": filename,
-                                "content_type": content_type,
-                                "data": file_data,
-                            })
-                        except Exception:
-                            pass
-
-                emails.append(EzMail(
-                    uid=uid_str,
-                    sender=sender_decoded,
-                    subject=subject_decoded or "(No subject)",
-                    body=(body_content or "").strip(),
-                    attachments=attachments,
-                    date=email_date,
-                ))
+                    body = ""
 
-            return emails
+            raw_date = msg.get("Date")
+            try:
+                email_date = parsedate_to_datetime(raw_date) if raw_date else None
+            except Exception:
+                email_date = None
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to fetch emails with the criteria {criteria}: {e}") from e
+            emails.append(EzMail(
+                uid=uid_str,
+                sender=_safe_decode(msg.get("From", "")),
+                subject=_safe_decode(msg.get("Subject", "")) or "(No subject)",
+                body=body,
+                attachments=file_parts.get(uid_str, []),
+                date=email_date,
+            ))
 
-    def fetch_unread(self, mailbox: str = "INBOX", limit: int | None = None) -> list[EzMail]:
+        return emails
+
+    def _parse_message(self, uid: str, raw: bytes) -> EzMail:
+        """Build an `EzMail` from a raw RFC 822 message.
+
+        The body and attachments are decoded right away, so the raw message
+        is not retained by the returned object.
+
+        Args:
+            uid (str): IMAP UID of the message.
+            raw (bytes): Full message as returned by ``BODY[]``.
+
+        Returns:
+            EzMail: Parsed message.
+        """
+        msg = _parse_headers(raw)
+
+        subject_decoded = _safe_decode(msg.get("Subject", ""))
+        sender_decoded = _safe_decode(msg.get("From", ""))
+        raw_date = msg.get("Date")
+
+        try:
+            email_date = parsedate_to_datetime(raw_date) if raw_date else None
+        except Exception:
+            email_date = None
+
+        body, attachments = _extract_content(raw)
+
+        return EzMail(
+            uid=uid,
+            sender=sender_decoded,
+            subject=subject_decoded or "(No subject)",
+            body=body,
+            attachments=attachments,
+            date=email_date,
+        )
+
+    def fetch_unread(
+        self,
+        mailbox: str = "INBOX",
+        limit: int | None = None,
+        include_attachments: bool = True,
+    ) -> list[EzMail]:
         """Convenience method to fetch unread messages.
 
         Args:
             mailbox (str): Mailbox to fetch from. Defaults to "INBOX".
             limit (int | None): Optional maximum number of messages.
+            include_attachments (bool): If False, attachment data is only
+                downloaded on access. See :meth:`fetch_messages`.
 
         Returns:
             list[EzMail]: Unread messages as `EzMail` objects.
@@ -350,7 +791,9 @@ class EzReader:
         Raises:
             RuntimeError: If not connected or on fetch errors.
         """
-        return self.fetch_messages(mailbox=mailbox, status="UNSEEN", limit=limit)
+        return self.fetch_messages(
+            mailbox=mailbox, status="UNSEEN", limit=limit, include_attachments=include_attachments
+        )
 
     def mark_as_unread(self, email: EzMail, mailbox: str = "INBOX") -> bool:
         """Remove the ``\\Seen`` flag (mark message as unread).
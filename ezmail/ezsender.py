@@ -1,18 +1,216 @@
 from __future__ import annotations
 
-from smtplib import SMTP, SMTP_SSL
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.application import MIMEApplication
-from email.mime.image import MIMEImage
-from email.mime.audio import MIMEAudio
+import logging
+from smtplib import SMTP, SMTP_SSL, SMTPServerDisconnected, SMTPRecipientsRefused, SMTPResponseException
+from email.message import EmailMessage, MIMEPart
+from email import policy
 from mimetypes import guess_type
 from uuid import uuid4
-from os.path import isfile, basename
-from re import sub
-from jinja2 import Template
-from time import sleep
-from .utils import validate_template, validate_image, validate_path, validate_sender, validate_protocol_config
+from secrets import token_hex
+from os.path import basename, getmtime, splitext
+from html.parser import HTMLParser
+from re import compile as re_compile
+from functools import lru_cache
+from time import sleep, monotonic
+from threading import Lock
+from queue import Queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from .utils import validate_template, validate_image, validate_path, validate_sender, validate_protocol_config, _file_base64, _file_version, _tls_context
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+_logger = logging.getLogger(__name__)
+
+# CRLF line endings, and 7-bit safe bodies (quoted-printable/base64) so
+# messages are valid even on servers without 8BITMIME.
+_MIME_POLICY = policy.SMTP.clone(cte_type="7bit")
+# Used when an address is non-ASCII and the message goes out with SMTPUTF8
+# (RFC 6532): headers carry raw UTF-8, since RFC 2047 encoded-words are not
+# allowed inside an addr-spec. Bodies keep their 7-bit transfer encodings.
+_UTF8_POLICY = _MIME_POLICY.clone(utf8=True)
+
+# Per-recipient messages are serialized once with this To: address, which is
+# then swapped for each recipient in the raw bytes. Only bare ASCII
+# addresses take that shortcut: anything the header registry could quote or
+# encode goes through a full serialization instead.
+_TO_PLACEHOLDER = f"ezmail-{uuid4().hex}@placeholder.invalid"
+_BARE_ADDRESS_RE = re_compile(r"[^\s\"(),:;<>@\[\\\]]+@[^\s\"(),:;<>@\[\\\]]+")
+
+
+class _TextExtractor(HTMLParser):
+    """Collect the text of an HTML document, skipping scripts and styles."""
+
+    _SKIP = frozenset({"script", "style", "head", "title"})
+    _BREAKS = frozenset({"br", "p", "div", "li", "tr", "td", "th", "h1", "h2", "h3", "h4", "h5", "h6"})
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP:
+            self._skipping += 1
+        elif tag in self._BREAKS:
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIP:
+            self._skipping = max(0, self._skipping - 1)
+        elif tag in self._BREAKS:
+            self.parts.append(" ")
+
+    def handle_data(self, data):
+        if not self._skipping:
+            self.parts.append(data)
+
+
+def _html_to_text(html: str) -> str:
+    """Convert HTML to a single line of plain text in one linear pass.
+
+    Tags are dropped, entities decoded and whitespace collapsed.
+    """
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    return " ".join("".join(parser.parts).split())
+
+
+def _new_boundary() -> str:
+    """Return a unique MIME boundary.
+
+    Shared multipart parts get their boundary up front; the generator would
+    otherwise set one on first flatten, mutating a part that may be
+    serialized from several threads.
+    """
+    return f"==============={uuid4().hex}=="
+
+
+# Common extensions resolved without consulting the mimetypes database.
+_FAST_MIME = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".svg": "image/svg+xml",
+    ".pdf": "application/pdf",
+}
+
+
+@lru_cache(maxsize=256)
+def _mime_type(path: str) -> str | None:
+    """Return the MIME type of `path` from its extension (None if unknown)."""
+    mime_type = _FAST_MIME.get(splitext(path)[1].lower())
+    return mime_type or guess_type(path)[0]
+
+
+class _ImageBlock:
+    """An inline image queued in the body by `EzSender.add_image()`.
+
+    Dict-style access (``block["image"]``) is supported for backward
+    compatibility with the dicts previously stored in `EzSender.body`.
+    """
+
+    __slots__ = ("image", "width", "height", "cid", "mime_type", "content_id", "part")
+
+    def __init__(self, image: str, width: str | None, height: str | None, cid: str | None, mime_type: str | None):
+        self.image = image
+        self.width = width
+        self.height = height
+        self.cid = cid
+        self.mime_type = mime_type
+        # Filled in by `EzSender.add_image()` once the image is encoded.
+        self.content_id = ""
+        self.part: MIMEPart | None = None
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def __repr__(self) -> str:
+        return f"<ImageBlock image={self.image!r} cid={self.cid!r}>"
+
+
+def _needs_smtputf8(*values: str) -> bool:
+    """Return True if any address needs SMTPUTF8 (i.e. is not plain ASCII)."""
+    return not "".join(values).isascii()
+
+
+def _refusal_reason(reason) -> str:
+    """Format an SMTP ``(code, response)`` refusal (or an error text) as a string."""
+    if isinstance(reason, tuple) and len(reason) == 2:
+        code, response = reason
+        if isinstance(response, bytes):
+            response = response.decode(errors="replace")
+        return f"{code} {response}"
+    return str(reason)
+
+
+class _PooledConnection:
+    """A `send_bulk()` worker connection with the usage tracked by `_get_conn()`."""
+
+    __slots__ = ("smtp", "messages", "last_used")
+
+    def __init__(self, smtp: SMTP | SMTP_SSL):
+        self.smtp = smtp
+        self.messages = 0
+        self.last_used = monotonic()
+
+
+def _is_dropped(error: Exception) -> bool:
+    """Return True if `error` means the server closed the session.
+
+    Besides an outright disconnect, servers that time out a session usually
+    answer the next command with ``421`` before closing, which smtplib
+    raises as an `SMTPResponseException` subclass.
+    """
+    return isinstance(error, SMTPServerDisconnected) or (
+        isinstance(error, SMTPResponseException) and error.smtp_code == 421
+    )
+
+
+def _quit_quietly(smtp: SMTP | SMTP_SSL) -> None:
+    """Quit an SMTP connection, ignoring errors from an already dead session."""
+    try:
+        smtp.quit()
+    except Exception:
+        try:
+            smtp.close()
+        except Exception:
+            pass
+
+
+def _quit_all(pool: Queue) -> None:
+    """Empty a queue of pooled connections, quitting each one."""
+    while not pool.empty():
+        _quit_quietly(pool.get_nowait().smtp)
+
+
+@lru_cache(maxsize=256)
+def _compiled_template(path: str, version: tuple) -> Template:
+    """Read and compile a Jinja2 template.
+
+    Cached per (path, `_file_version(path)`), so a rewritten template, or the
+    same relative path seen from another working directory, is compiled again
+    while repeated renders of an unchanged one skip parsing entirely. Jinja2 is
+    imported here, so senders that never use templates do not pay for it.
+    """
+    from jinja2 import Template
+
+    with open(path, "r", encoding="utf-8") as f:
+        return Template(f.read())
+
+
+def clear_template_cache() -> None:
+    """Drop every compiled template cached by `EzSender.use_template()`."""
+    _compiled_template.cache_clear()
 
 
 class EzSender:
@@ -20,7 +218,8 @@ class EzSender:
 
     Provides a simple interface to build professional emails with text/HTML,
     inline images, and attachments. Manages SMTP connection (context manager
-    friendly), MIME assembly, and optional rate limiting.
+    friendly, or explicit `open()`/`close()`), MIME assembly, and optional
+    rate limiting.
 
     Example:
         smtp = {"server": "smtp.domain.com", "port": 587}
@@ -33,7 +232,15 @@ class EzSender:
             ez.send(["user@domain.com"])
     """
 
-    def __init__(self, smtp: dict, sender: dict, max_emails_per_hour: int | None = None):
+    # Rotate the persistent connection after this many messages, since many
+    # providers cap the number of transactions accepted per session.
+    MAX_MESSAGES_PER_CONNECTION = 100
+
+    # Seconds a connection may sit unused before it is probed with NOOP;
+    # servers commonly drop idle sessions after a few minutes.
+    IDLE_TIMEOUT = 100
+
+    def __init__(self, smtp: dict, sender: dict, max_emails_per_hour: int | None = None, max_workers: int = 1):
         """Initialize the EzSender with SMTP config and sender credentials.
 
         Args:
@@ -44,10 +251,17 @@ class EzSender:
                 - email (str): Sender email address.
                 - password (str): Sender email password (or app password).
             max_emails_per_hour (int | None): Optional throttle to limit sent emails/hour.
+                Enforced with a single-token bucket: the first email goes out
+                immediately, then one more every ``3600 / max_emails_per_hour`` seconds,
+                so no hour ever carries more than `max_emails_per_hour` emails.
+            max_workers (int): Number of parallel SMTP connections `send()` uses for
+                individual emails (see `send_bulk()`). Defaults to 1 (serial).
 
         Raises:
             ValueError: If configuration/credentials are missing or invalid.
         """
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("'max_workers' must be a positive integer.")
         validate_protocol_config(smtp)
         validate_sender(sender)
 
@@ -58,10 +272,25 @@ class EzSender:
         self.sender_password = sender["password"]
 
         self.max_emails_per_hour = max_emails_per_hour
+        self.max_workers = max_workers
 
         self.subject: str | None = None
-        self.body: list[str | dict] = []
+        self.body: list[str | _ImageBlock] = []
+        self._image_cache: dict[tuple, tuple[str, MIMEPart | None]] = {}
+        self._cid_prefix = token_hex(3)
+        self._cid_counter = 0
         self.attachments: list[str] = []
+        self._attachment_parts: dict[str, MIMEPart] = {}
+
+        self._smtp_conn: SMTP | SMTP_SSL | None = None
+        self._conn_messages = 0
+        self._conn_last_used = 0.0
+        # Extra connections used by `send_bulk()` while a session is open.
+        self._worker_pool: Queue = Queue()
+
+        self._tokens = 1.0
+        self._last_refill = monotonic()
+        self._throttle_lock = Lock()
 
     def __enter__(self):
         """Open an SMTP connection for use in a `with` block.
@@ -69,21 +298,81 @@ class EzSender:
         Returns:
             EzSender: The instance with an active SMTP connection.
         """
-        self._smtp_conn = self.connect()
+        self.open()
         return self
 
     def __exit__(self, _exc_type, _exc_value, _traceback):
         """Ensure SMTP disconnection when leaving the context."""
+        self.close()
+
+    def open(self) -> None:
+        """Open a persistent SMTP connection reused by every `send()` call.
+
+        Does nothing if a connection is already open. Call `close()` when done,
+        or use the instance as a context manager instead.
+
+        Raises:
+            RuntimeError: If connection or authentication fails.
+        """
+        if self._smtp_conn is None:
+            self._smtp_conn = self.connect()
+            self._conn_messages = 0
+            self._conn_last_used = monotonic()
+
+    def close(self) -> None:
+        """Close the persistent SMTP connection and any pooled worker connections."""
         try:
-            if hasattr(self, "_smtp_conn") and self._smtp_conn:
+            if self._smtp_conn:
                 self._smtp_conn.quit()
         except Exception:
             pass
+        finally:
+            self._smtp_conn = None
+            self._conn_messages = 0
+            _quit_all(self._worker_pool)
+
+    def _reconnect(self) -> None:
+        """Drop the current SMTP connection and open a fresh one."""
+        self.close()
+        self.open()
+
+    def _get_conn(self) -> SMTP | SMTP_SSL:
+        """Return the persistent connection, replacing it when no longer usable.
+
+        A new connection is opened when none exists or the current one reached
+        `MAX_MESSAGES_PER_CONNECTION`. A connection idle for more than
+        `IDLE_TIMEOUT` seconds is probed with NOOP first; a recently used one
+        is returned without any extra round trip.
+
+        Returns:
+            SMTP | SMTP_SSL: Authenticated connection.
+        """
+        if self._smtp_conn is None or not self._is_usable(self._smtp_conn, self._conn_messages, self._conn_last_used):
+            self._reconnect()
+        return self._smtp_conn # type: ignore
+
+    def _is_usable(self, smtp: SMTP | SMTP_SSL, messages: int, last_used: float) -> bool:
+        """Check whether a connection can take another message.
+
+        False once it carried `MAX_MESSAGES_PER_CONNECTION` messages, or when
+        it was idle for more than `IDLE_TIMEOUT` seconds and no longer answers
+        NOOP.
+        """
+        if messages >= self.MAX_MESSAGES_PER_CONNECTION:
+            return False
+        if monotonic() - last_used <= self.IDLE_TIMEOUT:
+            return True
+        try:
+            return smtp.noop()[0] == 250
+        except Exception:
+            return False
 
     def connect(self) -> SMTP | SMTP_SSL:
         """Establish an authenticated SMTP connection.
 
         Uses implicit SSL for port 465 and STARTTLS for all other ports.
+        Exactly one EHLO is sent over the encrypted channel; `login()` reuses
+        its answer instead of greeting the server again.
 
         Returns:
             SMTP | SMTP_SSL: Authenticated SMTP connection object.
@@ -93,12 +382,20 @@ class EzSender:
         """
         try:
             if self.smtp_port == 465:
-                smtp = SMTP_SSL(self.smtp_server, self.smtp_port, timeout=30)
+                smtp = SMTP_SSL(self.smtp_server, self.smtp_port, timeout=30, context=_tls_context())
             else:
                 smtp = SMTP(self.smtp_server, self.smtp_port, timeout=30) # type: ignore
-                smtp.ehlo()
-                smtp.starttls()
-                smtp.ehlo()
+                # starttls() sends the required plaintext EHLO itself
+                smtp.starttls(context=_tls_context())
+            smtp.ehlo()
+            _logger.debug(
+                "SMTP server %s capabilities: PIPELINING=%s CHUNKING=%s 8BITMIME=%s SIZE=%s",
+                self.smtp_server,
+                smtp.has_extn("pipelining"),
+                smtp.has_extn("chunking"),
+                smtp.has_extn("8bitmime"),
+                smtp.esmtp_features.get("size"),
+            )
             smtp.login(self.sender_email, self.sender_password)
             return smtp
         except Exception as e:
@@ -120,6 +417,9 @@ class EzSender:
     def use_template(self, file: str, **variables) -> None:
         """Render a Jinja2 HTML template and append it to the body.
 
+        Compiled templates are cached until the file changes (see
+        `clear_template_cache()`).
+
         Args:
             file (str): Path to an HTML template file.
             **variables: Context variables for template rendering.
@@ -129,13 +429,15 @@ class EzSender:
             ValueError: If the template path or content is invalid.
         """
         validate_template(file)
-        with open(file, "r", encoding="utf-8") as f:
-            html = Template(f.read()).render(**variables)
-        self.add_text(html)
+        template = _compiled_template(file, _file_version(file))
+        self.add_text(template.render(**variables))
 
     def add_image(self, image_path: str, width: str | None = None, height: str | None = None, cid: str | None = None) -> None:
         """Queue an inline image to be embedded in the HTML body.
 
+        The image is read and encoded right away; sends reuse the resulting
+        MIME part without touching the filesystem.
+
         Args:
             image_path (str): Path to the image file.
             width (str | None): CSS width (e.g., "200px", "50%").
@@ -147,11 +449,16 @@ class EzSender:
             ValueError: If the image path is invalid.
         """
         validate_image(image_path)
-        self.body.append({"image": image_path, "width": width, "height": height, "cid": cid})
+        block = _ImageBlock(image_path, width, height, cid, _mime_type(image_path))
+        block.content_id, block.part = self._inline_image(block)
+        self.body.append(block)
 
     def add_attachment(self, attachment_path: str) -> None:
         """Attach a file to the message.
 
+        The file is read and encoded right away; the resulting MIME part is
+        reused by every subsequent `send()` until the attachments are cleared.
+
         Args:
             attachment_path (str): Path to the file to attach.
 
@@ -160,6 +467,7 @@ class EzSender:
             ValueError: If the path is invalid.
         """
         validate_path(attachment_path)
+        self._attachment_part(attachment_path)
         self.attachments.append(attachment_path)
 
     def set_subject(self, subject: str) -> None:
@@ -186,124 +494,323 @@ class EzSender:
     def clear_body(self) -> None:
         """Remove all accumulated body content (keeps SMTP state)."""
         self.body = []
+        self._image_cache = {}
 
     def clear_attachments(self) -> None:
         """Remove all queued attachments."""
         self.attachments = []
+        self._attachment_parts = {}
 
     def reset(self) -> None:
         """Clear subject, body, and attachments for reuse within the same session."""
         self.subject = None
         self.body = []
+        self._image_cache = {}
         self.attachments = []
+        self._attachment_parts = {}
 
-    def _build_body(self) -> tuple[str, list[MIMEImage]]:
+    def _inline_image(self, block: _ImageBlock) -> tuple[str, MIMEPart | None]:
+        """Return the Content-ID and MIME part of an inline image, cached per file.
+
+        Entries are keyed by path, requested cid and modification time, so an
+        image queued several times shares one encoded part while an edited
+        file is read again.
+
+        Args:
+            block (_ImageBlock): Image block being queued by `add_image()`.
+
+        Returns:
+            tuple[str, MIMEPart | None]: The Content-ID and the image part
+                (None if the file is not a recognized image type).
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        path = block.image
+        key = (path, block.cid, getmtime(path))
+        cached = self._image_cache.get(key)
+        if cached is not None:
+            return cached
+
+        cid = block.cid
+        if not cid:
+            cid = f"img{self._cid_prefix}{self._cid_counter:x}"
+            self._cid_counter += 1
+        mime_img = None
+        mime_type = block.mime_type
+        if mime_type and mime_type.startswith("image/"):
+            # Encoded straight from disk, like attachments.
+            mime_img = MIMEPart(policy=_MIME_POLICY)
+            mime_img["Content-Type"] = mime_type
+            mime_img["Content-Transfer-Encoding"] = "base64"
+            mime_img.add_header("Content-Disposition", "inline", filename=basename(path))
+            mime_img["Content-ID"] = f"<{cid}>"
+            mime_img.set_payload(_file_base64(path)[0])
+
+        self._image_cache[key] = (cid, mime_img)
+        return cid, mime_img
+
+    def _build_body(self) -> tuple[str, list[MIMEPart]]:
         """Assemble the unified HTML body and inline images.
 
         Returns:
-            tuple[str, list[MIMEImage]]: A tuple with:
+            tuple[str, list[MIMEPart]]: A tuple with:
                 - str: The final HTML body.
-                - list[MIMEImage]: Inline images already prepared with headers.
+                - list[MIMEPart]: Inline images already prepared with headers.
         """
         html_parts: list[str] = []
-        inline_images: list[MIMEImage] = []
+        inline_images: list[MIMEPart] = []
+        seen_images: set[int] = set()
 
         for block in self.body:
             if isinstance(block, str):
                 html_parts.append(block)
-            elif isinstance(block, dict) and "image" in block:
-                path = block["image"]
-                if isfile(path):
-                    cid = block.get("cid") or f"img{uuid4().hex[:8]}"
-                    width = block.get("width")
-                    height = block.get("height")
-
-                    style = ""
-                    if width or height:
-                        style = ' style="'
-                        if width:
-                            style += f"width:{width};"
-                        if height:
-                            style += f"height:{height};"
-                        style += '"'
-
-                    if not block.get("cid"):
-                        html_parts.append(f'<br><img src="cid:{cid}"{style}><br>')
-
-                    with open(path, "rb") as img_file:
-                        mime_type, _ = guess_type(path)
-                        if mime_type and mime_type.startswith("image/"):
-                            mime_img = MIMEImage(img_file.read(), _subtype=mime_type.split("/")[1])
-                            mime_img.add_header("Content-ID", f"<{cid}>")
-                            mime_img.add_header("Content-Disposition", "inline", filename=basename(path))
-                            inline_images.append(mime_img)
+            elif isinstance(block, _ImageBlock):
+                width = block.width
+                height = block.height
+                style = (
+                    f' style="{f"width:{width};" if width else ""}{f"height:{height};" if height else ""}"'
+                    if width or height else ""
+                )
+
+                if not block.cid:
+                    html_parts.append(f'<br><img src="cid:{block.content_id}"{style}><br>')
+
+                mime_img = block.part
+                if mime_img is not None and id(mime_img) not in seen_images:
+                    seen_images.add(id(mime_img))
+                    inline_images.append(mime_img)
 
         unified_body = "".join(html_parts)
         return unified_body, inline_images
 
-    def _build_message(self, to_header: str, unified_body: str, inline_images: list) -> MIMEMultipart:
-        """Assemble a complete MIME message ready to send.
+    def _build_alternative(self, unified_body: str, inline_images: list[MIMEPart]) -> MIMEPart:
+        """Assemble the multipart/alternative part (plain text + HTML).
+
+        Inline images are attached to the HTML alternative as a
+        multipart/related part, so clients resolve their ``cid:`` references
+        without listing them as attachments.
 
         Args:
-            to_header (str): Value for the To: header (single address or comma-joined list).
             unified_body (str): Final HTML body string.
-            inline_images (list[MIMEImage]): Inline images already prepared with headers.
+            inline_images (list[MIMEPart]): Inline images already prepared with headers.
 
         Returns:
-            MIMEMultipart: Fully assembled MIME message.
+            MIMEPart: The alternative part, ready to be attached.
         """
-        message = MIMEMultipart("mixed")
+        plain_text = _html_to_text(unified_body) or "Content not available."
+
+        alt = MIMEPart(policy=_MIME_POLICY)
+        alt.set_content(plain_text)
+        alt.add_alternative(unified_body, subtype="html")
+        alt.set_boundary(_new_boundary())
+
+        if inline_images:
+            html_part = alt.get_payload()[1]
+            html_part.make_related(boundary=_new_boundary())
+            for img in inline_images:
+                html_part.attach(img)
+
+        return alt
+
+    def _attachment_part(self, attachment_path: str) -> MIMEPart:
+        """Return the encoded MIME part for an attachment, building it only once.
+
+        Args:
+            attachment_path (str): Path of the file to attach.
+
+        Returns:
+            MIMEPart: Attachment part with Content-Disposition already set.
+        """
+        cached = self._attachment_parts.get(attachment_path)
+        if cached is not None:
+            return cached
+
+        file_name = basename(attachment_path)
+        mime_type = _mime_type(attachment_path)
+        main_type, sub_type = (
+            mime_type.split("/", 1) if mime_type else ("application", "octet-stream")
+        )
+
+        # Every type, text included, is base64-encoded straight from disk in
+        # chunks: the file is never fully loaded into a str. Text files are
+        # labelled UTF-8 only when their bytes decode as such; otherwise the
+        # charset is left unstated rather than guessed.
+        encoded, is_utf8 = _file_base64(attachment_path)
+        mime_attachment = MIMEPart(policy=_MIME_POLICY)
+        mime_attachment["Content-Type"] = f"{main_type}/{sub_type}"
+        if main_type == "text" and is_utf8:
+            mime_attachment.set_param("charset", "utf-8")
+        mime_attachment["Content-Transfer-Encoding"] = "base64"
+        mime_attachment.add_header("Content-Disposition", "attachment", filename=file_name)
+        mime_attachment.set_payload(encoded)
+
+        self._attachment_parts[attachment_path] = mime_attachment
+        return mime_attachment
+
+    def _build_attachments(self) -> list[MIMEPart]:
+        """Collect the MIME parts of every queued attachment.
+
+        Parts are built by `add_attachment()`, so repeated sends never
+        re-read or re-encode the files.
+
+        Returns:
+            list[MIMEPart]: Attachment parts with Content-Disposition already set.
+        """
+        return [self._attachment_part(attachment_path) for attachment_path in self.attachments]
+
+    def _build_message(self, to_header: str, alt: MIMEPart, attachments: list[MIMEPart]) -> EmailMessage:
+        """Wrap pre-built parts into a complete MIME message ready to send.
+
+        The parts are only referenced, never copied, so the same `alt` and
+        attachments can be shared by every recipient.
+
+        Args:
+            to_header (str): Value for the To: header (single address or comma-joined list).
+            alt (MIMEPart): Pre-built multipart/alternative body (with inline images).
+            attachments (list[MIMEPart]): Attachment parts already prepared with headers.
+
+        Returns:
+            EmailMessage: Fully assembled multipart/mixed message. Headers are
+                raw UTF-8 when an address is non-ASCII, matching the
+                ``SMTPUTF8`` request made by `_deliver()`.
+        """
+        utf8 = _needs_smtputf8(self.sender_email, to_header)
+        message = EmailMessage(policy=_UTF8_POLICY if utf8 else _MIME_POLICY)
         message["From"] = self.sender_email
         message["To"] = to_header
         message["Subject"] = self.subject or ""
+        message["MIME-Version"] = "1.0"
 
-        alt = MIMEMultipart("alternative")
-        plain_text = sub(r"<[^>]+>", "", unified_body)
-        plain_text = sub(r"\s+", " ", plain_text).strip() or "Content not available."
-
-        alt.attach(MIMEText(plain_text, "plain"))
-        alt.attach(MIMEText(unified_body, "html"))
+        message.make_mixed()
         message.attach(alt)
+        for attachment in attachments:
+            message.attach(attachment)
 
-        for img in inline_images:
-            message.attach(img)
-
-        for attachment_path in self.attachments:
-            if isfile(attachment_path):
-                with open(attachment_path, "rb") as f:
-                    file_name = basename(attachment_path)
-                    mime_type, _ = guess_type(attachment_path)
-                    main_type, sub_type = (
-                        mime_type.split("/", 1) if mime_type else ("application", "octet-stream")
-                    )
-
-                    if main_type == "text":
-                        mime_attachment = MIMEText(f.read().decode("utf-8", errors="ignore"), _subtype=sub_type)
-                    elif main_type == "image":
-                        mime_attachment = MIMEImage(f.read(), _subtype=sub_type) # type: ignore
-                    elif main_type == "audio":
-                        mime_attachment = MIMEAudio(f.read(), _subtype=sub_type) # type: ignore
-                    else:
-                        mime_attachment = MIMEApplication(f.read(), _subtype=sub_type) # type: ignore
+        return message
 
-                    mime_attachment.add_header("Content-Disposition", "attachment", filename=file_name)
-                    message.attach(mime_attachment)
+    def _personalize(self, template: bytes, recipient: str, alt: MIMEPart, attachments: list[MIMEPart]) -> bytes:
+        """Return the serialized message addressed to `recipient`.
 
-        return message
+        Bare ASCII addresses are substituted for `_TO_PLACEHOLDER` in the
+        pre-serialized `template`, skipping another walk of the MIME tree.
+        Other values (display names, non-ASCII, anything needing quoting)
+        get a freshly built and serialized message, so header validation
+        and encoding still apply.
+
+        Args:
+            template (bytes): Message serialized with `_TO_PLACEHOLDER` as To:.
+            recipient (str): Value for the To: header.
+            alt (MIMEPart): Pre-built multipart/alternative body.
+            attachments (list[MIMEPart]): Attachment parts.
+
+        Returns:
+            bytes: Message flattened with CRLF line endings.
+        """
+        if _BARE_ADDRESS_RE.fullmatch(recipient) and recipient.isascii():
+            return template.replace(_TO_PLACEHOLDER.encode("ascii"), recipient.encode("ascii"), 1)
+        return self._build_message(recipient, alt, attachments).as_bytes()
+
+    def _throttle(self, release_connection: bool = False) -> None:
+        """Wait for a send token to honour `max_emails_per_hour` (thread-safe).
 
-    def send(self, recipients: str | list[str], broadcast: bool = False) -> dict:
+        Tokens refill continuously at ``max_emails_per_hour / 3600`` per second.
+        The bucket holds a single token: any larger capacity would let a
+        burst plus the refill exceed `max_emails_per_hour` within one hour.
+        Each call takes one token, going into debt when none is left, and
+        sleeps only until that debt is repaid, so concurrent callers queue up
+        in order.
+
+        Args:
+            release_connection (bool): Close the persistent connection first
+                if the wait exceeds `IDLE_TIMEOUT`, instead of leaving it to
+                time out on the server; `_get_conn()` reopens it afterwards.
+        """
+        if not self.max_emails_per_hour:
+            return
+        rate = self.max_emails_per_hour / 3600.0
+        with self._throttle_lock:
+            now = monotonic()
+            self._tokens = min(1.0, self._tokens + (now - self._last_refill) * rate)
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            if release_connection and wait > self.IDLE_TIMEOUT:
+                self.close()
+            sleep(wait)
+
+    def _deliver(self, smtp: SMTP | SMTP_SSL, to_addrs: list[str], payload: bytes) -> dict:
+        """Run one SMTP transaction with an already serialized message.
+
+        Non-ASCII addresses request ``SMTPUTF8``, as `send_message()` would.
+        `SMTP.sendmail` itself declares ``SIZE=`` when the server supports it.
+
+        Args:
+            smtp (SMTP | SMTP_SSL): Authenticated connection.
+            to_addrs (list[str]): Envelope recipients.
+            payload (bytes): Message flattened with CRLF line endings.
+
+        Returns:
+            dict: Recipients refused by the server (see `SMTP.sendmail`).
+        """
+        mail_options = []
+        if _needs_smtputf8(self.sender_email, *to_addrs):
+            mail_options += ["SMTPUTF8", "BODY=8BITMIME"]
+        return smtp.sendmail(self.sender_email, to_addrs, payload, mail_options=mail_options)
+
+    def _sendmail(self, to_addrs: list[str], payload: bytes) -> dict:
+        """Send one serialized message over the persistent connection.
+
+        Callers flatten the message straight to CRLF bytes, so smtplib
+        neither re-encodes a `str` nor fixes its line endings.
+
+        The connection comes from `_get_conn()`; if the server still dropped
+        the session (disconnect or ``421``), it reconnects and retries once.
+
+        Args:
+            to_addrs (list[str]): Envelope recipients.
+            payload (bytes): Message flattened with CRLF line endings.
+
+        Returns:
+            dict: Recipients refused by the server, mapped to ``(code, response)``.
+
+        Raises:
+            SMTPRecipientsRefused: If every recipient was refused.
+        """
+        try:
+            refused = self._deliver(self._get_conn(), to_addrs, payload)
+        except (SMTPServerDisconnected, SMTPResponseException) as e:
+            if not _is_dropped(e):
+                raise
+            self._reconnect()
+            refused = self._deliver(self._smtp_conn, to_addrs, payload) # type: ignore
+        self._conn_messages += 1
+        self._conn_last_used = monotonic()
+        return refused
+
+    def send(self, recipients: str | list[str], broadcast: bool = False, bcc: bool = False) -> dict:
         """Compose and send the prepared message to one or multiple recipients.
 
-        Builds a MIME message (multipart/mixed with a multipart/alternative part),
-        attaches inline images and files, and sends the email. When used as a
-        context manager, reuses the existing SMTP connection; otherwise, creates
-        and closes a new connection around the operation.
+        Builds a MIME message (multipart/mixed with a multipart/alternative part
+        whose HTML alternative carries the inline images), attaches files, and
+        sends the email. When used as a
+        context manager (or after `open()`), reuses the existing SMTP connection;
+        otherwise, creates and closes a new connection around the operation.
+
+        Individual emails are delivered through `send_bulk()` when the sender
+        was created with ``max_workers`` > 1.
 
         Args:
             recipients (str | list[str]): Single email or list of emails.
             broadcast (bool): If True, sends one email with all recipients visible
                 in the To: header (group send). If False (default), sends individual
                 emails so each recipient sees only their own address.
+            bcc (bool): If True, sends one email to every recipient in a single
+                SMTP transaction with ``To: undisclosed-recipients:;`` so nobody
+                sees the other addresses. The message is transmitted once instead
+                of once per recipient, which is much faster for large lists, but
+                recipients do not see their own address in the To: header.
 
         Returns:
             dict: A summary with:
@@ -311,47 +818,157 @@ class EzSender:
                 - "failed" (dict[str, str]): Addresses mapped to error messages.
 
         Raises:
+            ValueError: If both `broadcast` and `bcc` are True.
             RuntimeError: If preparing or sending the message fails.
         """
+        if broadcast and bcc:
+            raise ValueError("'broadcast' and 'bcc' cannot be used together.")
         if not isinstance(recipients, (list, tuple)):
             recipients = [recipients]
 
+        if not (broadcast or bcc) and self.max_workers > 1 and len(recipients) > 1:
+            return self.send_bulk(recipients, workers=self.max_workers)
+
         result: dict = {"sent": [], "failed": {}}
 
+        close_after = self._smtp_conn is None
+
         try:
-            smtp = getattr(self, "_smtp_conn", None) or self.connect()
-            close_after = not hasattr(self, "_smtp_conn")
+            self.open()
 
+            # Everything except the headers is identical for every recipient,
+            # so the body, inline images and attachments are built only once.
             unified_body, inline_images = self._build_body()
+            alt = self._build_alternative(unified_body, inline_images)
+            attachments = self._build_attachments()
 
-            if broadcast:
+            if broadcast or bcc:
+                # A single transaction: the server reports refused addresses
+                # individually, so the others still count as sent.
                 try:
-                    to_header = ", ".join(recipients)
-                    message = self._build_message(to_header, unified_body, inline_images)
-                    smtp.sendmail(self.sender_email, list(recipients), message.as_string())
-                    result["sent"].extend(recipients)
+                    to_header = "undisclosed-recipients:;" if bcc else ", ".join(recipients)
+                    message = self._build_message(to_header, alt, attachments)
+                    refused = self._sendmail(list(recipients), message.as_bytes())
+                except SMTPRecipientsRefused as e:
+                    refused = e.recipients
                 except Exception as e:
-                    for recipient in recipients:
-                        result["failed"][recipient] = str(e)
+                    refused = {recipient: str(e) for recipient in recipients}
+                for recipient in recipients:
+                    if recipient in refused:
+                        result["failed"][recipient] = _refusal_reason(refused[recipient])
+                    else:
+                        result["sent"].append(recipient)
             else:
-                emails_sent = 0
+                # Serialized once; only the To: header changes per recipient.
+                template = self._build_message(_TO_PLACEHOLDER, alt, attachments).as_bytes()
                 for recipient in recipients:
                     try:
-                        message = self._build_message(recipient, unified_body, inline_images)
-                        smtp.sendmail(self.sender_email, [recipient], message.as_string())
+                        payload = self._personalize(template, recipient, alt, attachments)
+                        self._throttle(release_connection=True)
+                        self._sendmail([recipient], payload)
                         result["sent"].append(recipient)
-                        emails_sent += 1
-
-                        if self.max_emails_per_hour and emails_sent % self.max_emails_per_hour == 0:
-                            sleep(3600)
 
                     except Exception as e:
                         result["failed"][recipient] = str(e)
 
+        except Exception as e:
+            raise RuntimeError(f"Failed to prepare or send email: {e}") from e
+        finally:
             if close_after:
-                smtp.quit()
+                self.close()
+
+        return result
+
+    def send_bulk(self, recipients: str | list[str], workers: int = 4) -> dict:
+        """Send individual emails to many recipients over parallel SMTP connections.
+
+        Same result as `send()` with the default per-recipient mode, but
+        recipients are spread across `workers` threads, each with its own
+        authenticated SMTP connection, so network round trips overlap.
+        The message body, inline images and attachments are built once and
+        shared by every worker.
+
+        While a session is open (context manager or `open()`), the worker
+        connections are kept and reused by later calls until `close()`;
+        otherwise they are opened for this call only.
+
+        Args:
+            recipients (str | list[str]): Single email or list of emails.
+            workers (int): Number of parallel SMTP connections. Defaults to 4.
+
+        Returns:
+            dict: A summary with:
+                - "sent" (list[str]): Successfully delivered addresses.
+                - "failed" (dict[str, str]): Addresses mapped to error messages.
+
+        Raises:
+            ValueError: If `workers` is not a positive integer.
+            RuntimeError: If preparing the message or opening the connections fails.
+
+        Example:
+            >>> ez.send_bulk(subscribers, workers=8)
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("'workers' must be a positive integer.")
+        if not isinstance(recipients, (list, tuple)):
+            recipients = [recipients]
+
+        result: dict = {"sent": [], "failed": {}}
+        if not recipients:
+            return result
+
+        session = self._smtp_conn is not None
+        pool: Queue = self._worker_pool if session else Queue()
+        workers = min(workers, len(recipients))
+
+        try:
+            unified_body, inline_images = self._build_body()
+            alt = self._build_alternative(unified_body, inline_images)
+            attachments = self._build_attachments()
+
+            template = self._build_message(_TO_PLACEHOLDER, alt, attachments).as_bytes()
+
+            while pool.qsize() < workers:
+                pool.put(_PooledConnection(self.connect()))
+
+            def renew(conn: _PooledConnection) -> None:
+                _quit_quietly(conn.smtp)
+                conn.smtp = self.connect()
+                conn.messages = 0
+
+            def deliver(recipient: str) -> None:
+                payload = self._personalize(template, recipient, alt, attachments)
+                self._throttle()
+                conn = pool.get()
+                try:
+                    # Same rotation and idle probing as `_get_conn()`.
+                    if not self._is_usable(conn.smtp, conn.messages, conn.last_used):
+                        renew(conn)
+                    try:
+                        self._deliver(conn.smtp, [recipient], payload)
+                    except (SMTPServerDisconnected, SMTPResponseException) as e:
+                        if not _is_dropped(e):
+                            raise
+                        renew(conn)
+                        self._deliver(conn.smtp, [recipient], payload)
+                    conn.messages += 1
+                    conn.last_used = monotonic()
+                finally:
+                    pool.put(conn)
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [(recipient, executor.submit(deliver, recipient)) for recipient in recipients]
+                for recipient, future in futures:
+                    try:
+                        future.result()
+                        result["sent"].append(recipient)
+                    except Exception as e:
+                        result["failed"][recipient] = str(e)
 
         except Exception as e:
             raise RuntimeError(f"Failed to prepare or send email: {e}") from e
+        finally:
+            if not session:
+                _quit_all(pool)
 
         return result
@@ -1,9 +1,28 @@
 from __future__ import annotations
 
-from os.path import isfile
+from os import stat
+from os.path import isfile, realpath
 from datetime import datetime
+from functools import lru_cache
+from collections import OrderedDict
+from threading import Lock
+from ssl import SSLContext, create_default_context
+from base64 import encodebytes
+from codecs import getincrementaldecoder
 from email.header import decode_header, Header
 
+# Multiple of 57 bytes, so each chunk encodes to whole 76-char base64 lines.
+_BASE64_CHUNK_SIZE = 57 * 1024
+
+# Encoded payloads shared across senders: files larger than
+# _FILE_CACHE_MAX_FILE are never cached, and least recently used entries are
+# evicted once the cached text exceeds _FILE_CACHE_MAX_BYTES.
+_FILE_CACHE_MAX_FILE = 4 * 1024 * 1024
+_FILE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_file_cache: OrderedDict[tuple, tuple[str, bool]] = OrderedDict()
+_file_cache_bytes = 0
+_file_cache_lock = Lock()
+
 
 def _safe_decode(value, encoding: str | None = None) -> str:
     """Safely decode a bytes value or MIME-encoded header string.
@@ -40,6 +59,116 @@ def _safe_decode(value, encoding: str | None = None) -> str:
         return str(value)
 
 
+@lru_cache(maxsize=None)
+def _tls_context() -> SSLContext:
+    """Return the TLS context shared by every SMTP and IMAP connection.
+
+    Building a default context loads and parses the system CA store, so it
+    is created once (on first use) and reused for all handshakes.
+    """
+    return create_default_context()
+
+
+def _encode_file_base64(path: str) -> tuple[str, bool]:
+    """Base64-encode a file in fixed-size chunks, MIME line-wrapped.
+
+    Chunks are read into one preallocated buffer, so only that buffer and the
+    encoded text are held in memory, instead of the whole file plus its
+    encoded copy. Each chunk is also fed to an incremental UTF-8 decoder, so
+    text files can be labelled with the right charset.
+
+    Args:
+        path (str): Path of the file to encode.
+
+    Returns:
+        tuple[str, bool]: Base64 text split into 76-character lines, and
+            whether the file is valid UTF-8.
+    """
+    encoded: list[str] = []
+    buffer = bytearray(_BASE64_CHUNK_SIZE)
+    view = memoryview(buffer)
+    decoder = getincrementaldecoder("utf-8")()
+    is_utf8 = True
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            chunk = view[:size]
+            encoded.append(encodebytes(chunk).decode("ascii"))
+            if is_utf8:
+                try:
+                    decoder.decode(chunk)
+                except UnicodeDecodeError:
+                    is_utf8 = False
+    if is_utf8:
+        try:
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            is_utf8 = False
+    return "".join(encoded), is_utf8
+
+
+def _file_version(path: str) -> tuple:
+    """Identify the current contents of a file for cache lookups.
+
+    Uses the resolved path plus device, inode, nanosecond mtime and size, so
+    a different working directory or a rewrite of the file never hits a
+    stale entry.
+    """
+    st = stat(path)
+    return (realpath(path), st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _file_base64(path: str) -> tuple[str, bool]:
+    """Return the base64 encoding of a file, shared across senders and sends.
+
+    Small files are kept in a process-wide LRU cache bounded by total size
+    (see `clear_file_cache()`); larger ones are encoded on every call.
+
+    Args:
+        path (str): Path of the file to encode.
+
+    Returns:
+        tuple[str, bool]: Base64 text split into 76-character lines, and
+            whether the file is valid UTF-8.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    global _file_cache_bytes
+
+    key = _file_version(path)
+    with _file_cache_lock:
+        entry = _file_cache.get(key)
+        if entry is not None:
+            _file_cache.move_to_end(key)
+            return entry
+
+    entry = _encode_file_base64(path)
+    # Skip caching large files, and files modified while being read.
+    if key[-1] > _FILE_CACHE_MAX_FILE or _file_version(path) != key:
+        return entry
+
+    with _file_cache_lock:
+        if key not in _file_cache:
+            _file_cache[key] = entry
+            _file_cache_bytes += len(entry[0])
+            while _file_cache_bytes > _FILE_CACHE_MAX_BYTES:
+                _, evicted = _file_cache.popitem(last=False)
+                _file_cache_bytes -= len(evicted[0])
+    return entry
+
+
+def clear_file_cache() -> None:
+    """Drop every encoded attachment and inline image payload cached in memory."""
+    global _file_cache_bytes
+
+    with _file_cache_lock:
+        _file_cache.clear()
+        _file_cache_bytes = 0
+
+
 def validate_path(path: str) -> None:
     """Validates whether a given path points to an existing file.
 
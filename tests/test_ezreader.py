@@ -0,0 +1,231 @@
+"""Tests for the IMAP response parsing helpers used by EzReader.
+
+The ``data`` lists below mirror what ``imaplib`` returns: literals arrive as
+``(line, payload)`` tuples followed by the rest of the line as bytes.
+"""
+
+import unittest
+
+from ezmail import EzReader
+from ezmail.ezreader import (
+    _leaf_disposition,
+    _parse_fetch_response,
+    _parse_list_entry,
+    _quote_string,
+    _structure_param,
+    _walk_bodystructure,
+)
+
+IMAP = {"server": "imap.domain.com", "port": 993}
+ACCOUNT = {"email": "me@domain.com", "auth_value": "secret", "auth_type": "password"}
+
+# Recorded UID FETCH (UID BODYSTRUCTURE BODY.PEEK[HEADER]) response: a
+# multipart/mixed message whose PDF name is sent as a literal and which
+# carries a forwarded message/rfc822 part, plus an unsolicited FLAGS update.
+STRUCTURE_FETCH = [
+    (
+        b'1 (UID 101 BODYSTRUCTURE (("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "7BIT" 5 1 NIL NIL NIL NIL)'
+        b'("APPLICATION" "PDF" ("NAME" {10}',
+        "résum.pdf".encode(),
+    ),
+    (
+        b') NIL NIL "BASE64" 100 NIL ("ATTACHMENT" ("FILENAME" "cv.pdf")) NIL NIL)'
+        b'("MESSAGE" "RFC822" NIL NIL NIL "7BIT" 300 (NIL "Fwd" NIL NIL NIL NIL NIL NIL NIL NIL) '
+        b'("TEXT" "PLAIN" ("CHARSET" "us-ascii") NIL NIL "7BIT" 10 1 NIL NIL NIL NIL) 12 NIL '
+        b'("ATTACHMENT" ("FILENAME" "fwd.eml")) NIL NIL) "MIXED" ("BOUNDARY" "xyz") NIL NIL NIL) '
+        b'BODY[HEADER] {44}',
+        b"From: a@b.c\r\nSubject: Report\r\nX-Pad: 1\r\n\r\n",
+    ),
+    b")",
+    b"2 (FLAGS (\\Seen))",
+]
+
+
+class _StubIMAP:
+    """Replays canned responses for the imaplib calls EzReader makes."""
+
+    def __init__(self, fetch=None, listing=None):
+        self.fetch = fetch or {}
+        self.listing = listing or []
+        self.calls = []
+
+    def uid(self, command, uids, items):
+        self.calls.append((command, uids, items))
+        return "OK", self.fetch.get(items, [])
+
+    def list(self):
+        return "OK", self.listing
+
+
+class ParseFetchResponseTests(unittest.TestCase):
+    def test_literals_inside_bodystructure(self):
+        first = _parse_fetch_response(STRUCTURE_FETCH)[0]
+
+        self.assertEqual(first[b"UID"], b"101")
+        self.assertTrue(first[b"BODY[HEADER]"].startswith(b"From: a@b.c"))
+        pdf = first[b"BODYSTRUCTURE"][1]
+        self.assertEqual(pdf[:2], [b"APPLICATION", b"PDF"])
+        self.assertEqual(pdf[2], [b"NAME", "résum.pdf".encode()])
+        self.assertIsNone(pdf[3])
+
+    def test_unsolicited_flags_response_is_kept_separate(self):
+        responses = _parse_fetch_response(STRUCTURE_FETCH)
+
+        self.assertEqual(len(responses), 2)
+        self.assertEqual(responses[1], {b"FLAGS": [b"\\Seen"]})
+
+    def test_several_messages_and_trailing_items(self):
+        data = [
+            (b"1 (UID 7 BODY[] {5}", b"hello"),
+            b" FLAGS (\\Seen))",
+            (b"2 (UID 8 BODY[] {0}", b""),
+            b")",
+        ]
+
+        responses = _parse_fetch_response(data)
+
+        self.assertEqual([r[b"UID"] for r in responses], [b"7", b"8"])
+        self.assertEqual(responses[0][b"BODY[]"], b"hello")
+        self.assertEqual(responses[0][b"FLAGS"], [b"\\Seen"])
+        self.assertEqual(responses[1][b"BODY[]"], b"")
+
+    def test_quoted_strings_and_nil(self):
+        data = [b'1 (UID 9 X-ITEM "a \\"quoted\\" \\\\ value" OTHER NIL)']
+
+        item = _parse_fetch_response(data)[0]
+
+        self.assertEqual(item[b"X-ITEM"], b'a "quoted" \\ value')
+        self.assertIsNone(item[b"OTHER"])
+
+    def test_uid_fetch_skips_responses_without_uid(self):
+        reader = EzReader(IMAP, ACCOUNT)
+        reader.mail = _StubIMAP(fetch={"(UID BODYSTRUCTURE)": STRUCTURE_FETCH})
+
+        fetched = reader._uid_fetch([b"101"], "(UID BODYSTRUCTURE)")
+
+        self.assertEqual(list(fetched), ["101"])
+
+
+class BodystructureTests(unittest.TestCase):
+    def setUp(self):
+        self.structure = _parse_fetch_response(STRUCTURE_FETCH)[0][b"BODYSTRUCTURE"]
+
+    def test_sections_and_message_rfc822_leaf(self):
+        leaves = list(_walk_bodystructure(self.structure))
+
+        self.assertEqual([section for section, _ in leaves], ["1", "2", "3"])
+        self.assertEqual(leaves[2][1][:2], [b"MESSAGE", b"RFC822"])
+
+    def test_nested_multipart_sections(self):
+        text = [b"TEXT", b"PLAIN", [b"CHARSET", b"utf-8"], None, None, b"7BIT", b"5", b"1"]
+        html = [b"TEXT", b"HTML", [b"CHARSET", b"utf-8"], None, None, b"7BIT", b"9", b"1"]
+        png = [b"IMAGE", b"PNG", [b"NAME", b"logo.png"], None, None, b"BASE64", b"40"]
+        structure = [[text, [html, png, b"RELATED"], b"ALTERNATIVE"], png, b"MIXED"]
+
+        sections = [section for section, _ in _walk_bodystructure(structure)]
+
+        self.assertEqual(sections, ["1.1", "1.2.1", "1.2.2", "2"])
+
+    def test_single_part_message_is_section_1(self):
+        leaf = [b"TEXT", b"PLAIN", None, None, None, b"7BIT", b"5", b"1"]
+
+        self.assertEqual(list(_walk_bodystructure(leaf)), [("1", leaf)])
+
+    def test_dispositions_by_part_type(self):
+        leaves = [leaf for _, leaf in _walk_bodystructure(self.structure)]
+
+        self.assertEqual(_leaf_disposition(leaves[0]), (b"", None))
+        self.assertEqual(_leaf_disposition(leaves[1]), (b"attachment", [b"FILENAME", b"cv.pdf"]))
+        self.assertEqual(_leaf_disposition(leaves[2]), (b"attachment", [b"FILENAME", b"fwd.eml"]))
+
+    def test_structure_params(self):
+        params = [b"NAME", b"=?utf-8?q?r=C3=A9sum=C3=A9.pdf?=", b"FILENAME*", b"utf-8''caf%C3%A9.txt"]
+
+        self.assertEqual(_structure_param(params, b"name"), "résumé.pdf")
+        self.assertEqual(_structure_param(params, b"filename"), "café.txt")
+        self.assertIsNone(_structure_param(params, b"charset"))
+        self.assertIsNone(_structure_param(None, b"name"))
+
+    def test_fetch_without_attachments_lists_remote_files(self):
+        reader = EzReader(IMAP, ACCOUNT)
+        reader.mail = _StubIMAP(fetch={
+            "(UID BODYSTRUCTURE BODY.PEEK[HEADER])": STRUCTURE_FETCH,
+            "(UID BODY.PEEK[1])": [(b"1 (UID 101 BODY[1] {5}", b"Hello"), b")"],
+        })
+
+        [mail] = reader._fetch_without_attachments([b"101"], "INBOX")
+
+        self.assertEqual(mail.subject, "Report")
+        self.assertEqual(mail.body, "Hello")
+        self.assertEqual(
+            [(a.filename, a.content_type) for a in mail.attachments],
+            [("cv.pdf", "application/pdf"), ("fwd.eml", "message/rfc822")],
+        )
+        self.assertEqual(len(reader.mail.calls), 2)
+
+
+class SearchQuotingTests(unittest.TestCase):
+    def test_quotes_and_backslashes_are_escaped(self):
+        self.assertEqual(_quote_string('say "hi" \\ bye'), '"say \\"hi\\" \\\\ bye"')
+
+    def test_line_breaks_are_rejected(self):
+        for value in ("x\r\nA1 DELETE INBOX", "x\nA1 DELETE INBOX", "x\r"):
+            with self.assertRaises(ValueError):
+                _quote_string(value)
+
+    def test_fetch_messages_rejects_injected_command_before_sending(self):
+        reader = EzReader(IMAP, ACCOUNT)
+        reader.mail = _StubIMAP()
+
+        with self.assertRaises(ValueError):
+            reader.fetch_messages(subject="x\r\nA1 DELETE INBOX")
+        self.assertEqual(reader.mail.calls, [])
+
+
+class ListEntryTests(unittest.TestCase):
+    def test_atom_name(self):
+        self.assertEqual(
+            _parse_list_entry(b'(\\HasNoChildren) "/" INBOX'),
+            ({"\\HasNoChildren"}, "/", "INBOX"),
+        )
+
+    def test_quoted_name_with_other_delimiter(self):
+        self.assertEqual(
+            _parse_list_entry(b'(\\HasNoChildren \\Trash) "." "INBOX.Deleted Items"'),
+            ({"\\HasNoChildren", "\\Trash"}, ".", "INBOX.Deleted Items"),
+        )
+
+    def test_quoted_name_with_escapes(self):
+        self.assertEqual(_parse_list_entry(b'() "\\\\" "a\\"b\\\\c"'), (set(), "\\", 'a"b\\c'))
+
+    def test_nil_delimiter(self):
+        self.assertEqual(_parse_list_entry(b"(\\Noselect) NIL Flat"), ({"\\Noselect"}, None, "Flat"))
+
+    def test_literal_name(self):
+        entry = (b'(\\HasNoChildren) "/" {12}', 'Relatórios'.encode())
+
+        self.assertEqual(_parse_list_entry(entry), ({"\\HasNoChildren"}, "/", "Relatórios"))
+
+    def test_non_list_lines_are_ignored(self):
+        self.assertIsNone(_parse_list_entry(b"garbage"))
+        self.assertIsNone(_parse_list_entry(None))
+
+    def test_list_mailboxes(self):
+        reader = EzReader(IMAP, ACCOUNT)
+        reader.mail = _StubIMAP(listing=[
+            b'(\\HasNoChildren) "/" INBOX',
+            b'(\\HasChildren \\Noselect) "/" "[Gmail]"',
+            (b'(\\HasNoChildren) "/" {12}', 'Relatórios'.encode()),
+            b"",
+            b'(\\HasNoChildren) NIL "Deleted Items"',
+        ])
+
+        self.assertEqual(reader.list_mailboxes(), ["INBOX", "[Gmail]", "Relatórios", "Deleted Items"])
+        self.assertEqual(
+            [(delim, name) for _, delim, name in reader._list_mailboxes_detailed()],
+            [("/", "INBOX"), ("/", "[Gmail]"), ("/", "Relatórios"), ("/", "Deleted Items")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Tests for EzSender's per-recipient serialization and attachment parts."""
+
+import os
+import tempfile
+import unittest
+from email import message_from_bytes, policy
+
+from ezmail import EzSender
+from ezmail.ezsender import _TO_PLACEHOLDER
+from ezmail.utils import _BASE64_CHUNK_SIZE, clear_file_cache
+
+SMTP = {"server": "smtp.domain.com", "port": 587}
+SENDER = {"email": "me@domain.com", "password": "secret"}
+
+
+class PersonalizeTests(unittest.TestCase):
+    def setUp(self):
+        self.ez = EzSender(SMTP, SENDER)
+        self.ez.set_subject("Hello")
+        self.ez.add_text("<p>Hi there</p>")
+        unified_body, inline_images = self.ez._build_body()
+        self.alt = self.ez._build_alternative(unified_body, inline_images)
+        self.template = self.ez._build_message(_TO_PLACEHOLDER, self.alt, []).as_bytes()
+
+    def personalize(self, recipient: str) -> bytes:
+        return self.ez._personalize(self.template, recipient, self.alt, [])
+
+    def to_header(self, payload: bytes) -> str:
+        return message_from_bytes(payload, policy=policy.default)["To"]
+
+    def test_bare_address_is_swapped_in_place(self):
+        payload = self.personalize("user@domain.com")
+
+        self.assertEqual(payload, self.template.replace(_TO_PLACEHOLDER.encode(), b"user@domain.com"))
+        self.assertIn(b"\r\nTo: user@domain.com\r\n", payload)
+        self.assertNotIn(_TO_PLACEHOLDER.encode(), payload)
+
+    def test_only_the_header_changes(self):
+        first, second = self.personalize("a@domain.com"), self.personalize("b@domain.com")
+
+        self.assertEqual(first.split(b"\r\n\r\n", 1)[1], second.split(b"\r\n\r\n", 1)[1])
+        self.assertEqual(self.to_header(first), "a@domain.com")
+        self.assertEqual(self.to_header(second), "b@domain.com")
+
+    def test_display_name_is_fully_serialized(self):
+        payload = self.personalize('"Doe, John" <john@domain.com>')
+
+        self.assertNotIn(_TO_PLACEHOLDER.encode(), payload)
+        self.assertEqual(self.to_header(payload).addresses[0].addr_spec, "john@domain.com")
+        self.assertEqual(self.to_header(payload).addresses[0].display_name, "Doe, John")
+
+    def test_non_ascii_address_uses_utf8_header(self):
+        payload = self.personalize("josé@domain.com")
+        headers, body = payload.split(b"\r\n\r\n", 1)
+
+        self.assertNotIn(_TO_PLACEHOLDER.encode(), payload)
+        self.assertIn("\r\nTo: josé@domain.com\r\n".encode(), headers + b"\r\n")
+        self.assertNotIn(b"=?utf-8?", headers)
+        self.assertTrue(body.isascii())
+
+    def test_header_injection_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.personalize("user@domain.com\r\nBcc: victim@domain.com")
+
+
+class AttachmentCharsetTests(unittest.TestCase):
+    def setUp(self):
+        self.ez = EzSender(SMTP, SENDER)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(clear_file_cache)
+
+    def part_for(self, content: bytes):
+        path = os.path.join(self.tmp.name, "notes.txt")
+        with open(path, "wb") as f:
+            f.write(content)
+        return self.ez._attachment_part(path)
+
+    def test_utf8_text_is_labelled(self):
+        part = self.part_for("Olá, mundo\n".encode("utf-8"))
+
+        self.assertEqual(part.get_content_charset(), "utf-8")
+        self.assertEqual(part.get_payload(decode=True), "Olá, mundo\n".encode("utf-8"))
+
+    def test_utf8_sequence_split_across_chunks_is_labelled(self):
+        part = self.part_for(b"a" * (_BASE64_CHUNK_SIZE - 1) + "é".encode("utf-8"))
+
+        self.assertEqual(part.get_content_charset(), "utf-8")
+
+    def test_non_utf8_text_has_no_charset(self):
+        part = self.part_for("Olá, mundo\n".encode("latin-1"))
+
+        self.assertIsNone(part.get_content_charset())
+        self.assertEqual(part.get_content_type(), "text/plain")
+
+
+if __name__ == "__main__":
+    unittest.main()